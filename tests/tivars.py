@@ -1,5 +1,7 @@
+import copy
 import json
 import unittest
+import warnings
 
 from decimal import Decimal
 
@@ -23,6 +25,9 @@ class VarTests(unittest.TestCase):
 
         self.assertEqual(test_var.header, test_header)
 
+        with open("tests/data/var/Program.8xp", 'rb') as file:
+            self.assertEqual(TIHeader(data=file), test_header)
+
         self.assertEqual(type(test_var.entries[0]), TIProgram)
         self.assertEqual(type(test_var.entries[0]).type_id, 0x05)
 
@@ -143,6 +148,14 @@ class EntryTests(unittest.TestCase):
         self.assertEqual(f"{test_program}", "setDate(1")
         self.assertEqual(f"{test_program:-2X:}", "0300:EF00:31")
 
+    def test_copy(self):
+        test_program = TIEntry.open("tests/data/var/Program.8xp")
+        test_copy = copy.copy(test_program)
+        self.assertEqual(test_copy, test_program)
+
+        test_copy.load_string("Disp 1")
+        self.assertEqual(test_program.string(), "setDate(1")
+
 
 class TokenizationTests(unittest.TestCase):
     def test_load_from_file(self):
@@ -174,6 +187,7 @@ class TokenizationTests(unittest.TestCase):
 
         self.assertEqual(test_program.tokens(), [TI_84PCE.tokens["setDate("],
                                                  TI_84PCE.tokens[b'1']])
+        self.assertEqual(list(test_program), test_program.tokens())
 
         # Version is wrong(?)
         test_program.version = 0x04
@@ -210,8 +224,27 @@ class TokenizationTests(unittest.TestCase):
         test_program = TIProgram.open("tests/data/var/COLORZ.8xp")
         self.assertEqual(type(test_program), TIProtectedAsmProgram)
 
+        test_program.coerce()
+        self.assertEqual(type(test_program), TIProtectedAsmProgram)
+
         self.assertEqual(test_program.decode(test_program.data[:26]), "Disp \"Needs Doors CSE\"")
 
+    def test_illegal_tokens(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            test_program = TIProgram(data=b'\xBB\xD0\x3F\x00\x31')
+
+        # Decoding results are cached, but the warnings must be emitted on every call
+        for _ in range(2):
+            with self.assertWarns(BytesWarning):
+                test_program.tokens()
+
+            with self.assertWarns(BytesWarning):
+                test_program.get_version()
+
+            with self.assertWarns(BytesWarning):
+                test_program.string()
+
     def test_modes(self):
         interpolation = "A and B:Disp \"A and B\":Send(\"SET SOUND eval(A and B) TIME 2"
         names = "Disp \"WHITE,ʟWHITE,prgmWHITE\",WHITE,ʟWHITE:prgmWHITE:prgmABCDEF"
@@ -478,6 +511,11 @@ class SettingsTests(unittest.TestCase):
         self.assertEqual(test_window.Ymin, TIReal(-20))
         self.assertEqual(test_window.Yscl, TIReal("2"))
 
+        # JSON does not record undefined reals, which are loaded as ordinary reals
+        loaded = TIWindowSettings(test_window.string())
+        self.assertEqual(loaded.dict(), test_window.dict())
+        self.assertEqual(loaded.unMin0, TIReal(1))
+
     def test_recall(self):
         test_recall = TIRecallWindow.open("tests/data/var/RecallWindow.8xz")
 
@@ -512,6 +550,11 @@ class SettingsTests(unittest.TestCase):
         self.assertEqual(test_recall.Ymin, TIReal("-10"))
         self.assertEqual(test_recall.Yscl, TIReal(1))
 
+        # JSON does not record undefined reals, which are loaded as ordinary reals
+        loaded = TIRecallWindow(test_recall.string())
+        self.assertEqual(loaded.dict(), test_recall.dict())
+        self.assertEqual(loaded.unMin0, TIReal(1))
+
     def test_table(self):
         test_table = TITableSettings.open("tests/data/var/TableRange.8xt")
 
@@ -519,6 +562,24 @@ class SettingsTests(unittest.TestCase):
         self.assertEqual(test_table.TblMin, TIReal(0.0))
         self.assertEqual(test_table.DeltaTbl, TIReal("1"))
 
+        self.assertEqual(TITableSettings(test_table.string()).calc_data, test_table.calc_data)
+
+        with self.assertRaisesRegex(TypeError, "TblMin"):
+            TITableSettings('{"TblMin": [0]}')
+
+    def test_integer(self):
+        # Fractional and malformed mantissas must read the same as through a float
+        for data in ["008012800000000000", "808131415926535897", "007f12800000000000",
+                     "00801a280000000000", "007f1a280000000000", "0080128a0000000000"]:
+            data = bytes.fromhex(data)
+            self.assertEqual(TIWindowSettings._int(data), int(TIWindowSettings._float(data)))
+
+        # Malformed mantissas must be checked the same as through a float
+        for data in ["008012800000000000", "008112800000000000", "008beeb046cc91fa8f", "00801a280000000000"]:
+            data = bytes.fromhex(data)
+            value = TIWindowSettings._float(data)
+            self.assertEqual(TIWindowSettings._is_integer(data), int(value) == value)
+
 
 class GDBTests(unittest.TestCase):
     def test_func_gdb(self):
@@ -575,6 +636,12 @@ class GDBTests(unittest.TestCase):
 
         self.assertEqual(test_gdb.length, 142)
 
+    def test_graphed_equation(self):
+        # The flag byte comes first, so the length is stored after it
+        test_equation = TIGraphedEquation()
+        self.assertEqual(test_equation.calc_data, b'\x03\x01\x00')
+        self.assertEqual(test_equation.length, 1)
+
 
 class PictureTests(unittest.TestCase):
     def test_mono_picture(self):
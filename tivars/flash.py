@@ -200,7 +200,7 @@ class TIFlashBlock(Dock):
         self.block_type = block_type
 
         if data:
-            self.data = bytearray(data)
+            self.data = data
 
         elif init is not None:
             if hasattr(init, "bytes"):
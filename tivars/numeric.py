@@ -67,6 +67,13 @@ class BCD(Converter):
         :return: The number stored in ``data``
         """
 
+        try:
+            # Valid BCD digits are exactly the hex digits of the data
+            return int(data.hex())
+
+        except ValueError:
+            pass
+
         value = 0
         for byte in data:
             value *= 100
@@ -107,6 +114,12 @@ class LeftNibbleBCD(Converter):
         :return: The number stored in ``data``
         """
 
+        try:
+            return int(data.hex()[1:])
+
+        except ValueError:
+            pass
+
         value = data[0] % 16
         for byte in data[1:]:
             value *= 100
@@ -150,6 +163,12 @@ class RightNibbleBCD(Converter):
         :return: The number stored in ``data``
         """
 
+        try:
+            return int(data.hex()[:-1])
+
+        except ValueError:
+            pass
+
         value = 0
         for byte in data[:-1]:
             value *= 100
@@ -54,5 +54,5 @@ class Name(TokenizedString):
         return data
 
 
-__all__ = ["decode", "encode", "normalize", "Name", "TokenizedString",
+__all__ = ["decode", "decode_iter", "encode", "normalize", "Name", "TokenizedString",
            "TIToken", "IllegalToken", "TITokenTrie", "TITokens", "OsVersion", "OsVersions"]
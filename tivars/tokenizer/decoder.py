@@ -3,6 +3,7 @@ Token stream decoder
 """
 
 
+from typing import Iterator
 from warnings import warn
 
 from tivars.models import *
@@ -10,6 +11,51 @@ from tivars.token import *
 from tivars.trie import *
 
 
+def _decode(bytestream: bytes, first_bytes: list, used: dict) -> Iterator[TIToken]:
+    index = 0
+    length = len(bytestream)
+    while index < length:
+        if not bytestream[index]:
+            count = 1
+            while index + count < length and not bytestream[index + count]:
+                count += 1
+
+            # Trailing null bytes are dropped
+            if index + count == length:
+                return
+
+            index += count
+
+            warn(f"There are {count} unexpected null bytes at position {index}." if count > 1 else
+                 f"There is an unexpected null byte at position {index}.",
+                 BytesWarning)
+
+            for _ in range(count):
+                yield IllegalToken(b'\x00')
+
+            continue
+
+        token = first_bytes[bytestream[index]]
+        if isinstance(token, dict):
+            # A lone leading byte at the end is dropped
+            if index + 1 == length:
+                return
+
+            index += 1
+            if (token := token.get(bytestream[index])) is None:
+                curr_bytes = bytes(bytestream[index - 1:index + 1])
+                warn(f"Unrecognized byte(s) '0x{curr_bytes.hex()}' at position {index}.",
+                     BytesWarning)
+
+                yield IllegalToken(curr_bytes)
+                index += 1
+                continue
+
+        used[id(token)] = token
+        yield token
+        index += 1
+
+
 def decode(bytestream: bytes, *, tokens: TITokens = None) -> tuple[list[TIToken], OsVersion]:
     """
     Decodes a byte stream into a list of `TIToken` objects and its minimum supported OS version
@@ -24,48 +70,25 @@ def decode(bytestream: bytes, *, tokens: TITokens = None) -> tuple[list[TIToken]
     :return: A tuple of a list of `TIToken` objects and a minimum `OsVersion`
     """
 
-    tokens = tokens or TI_84PCE.tokens
-
-    out = []
-    since = OsVersions.INITIAL
-
-    index = 0
-    curr_bytes = b''
-    while index < len(bytestream):
-        curr_bytes += bytestream[index:][:1]
-        curr_hex = curr_bytes.hex()
-
-        if curr_bytes[0]:
-            if curr_bytes in tokens.bytes:
-                out.append(tokens.bytes[curr_bytes])
-                since = max(tokens.bytes[curr_bytes].since, since)
+    used = {}
+    out = list(_decode(bytestream, (tokens or TI_84PCE.tokens).first_bytes, used))
 
-                curr_bytes = b''
+    # Comparing versions is slow, so only each distinct token is compared
+    return out, max([OsVersions.INITIAL, *(token.since for token in used.values())])
 
-            elif len(curr_bytes) >= 2:
-                warn(f"Unrecognized byte(s) '0x{curr_hex}' at position {index}.",
-                     BytesWarning)
-
-                out.append(IllegalToken(curr_bytes))
-                curr_bytes = b''
-
-        elif curr_bytes[-1]:
-            count = 0
-            while not curr_bytes[0]:
-                curr_bytes = curr_bytes[1:]
-                count += 1
-                out.append(IllegalToken(b'\x00'))
 
-            warn(f"There are {count} unexpected null bytes at position {index}." if count > 1 else
-                 f"There is an unexpected null byte at position {index}.",
-                 BytesWarning)
+def decode_iter(bytestream: bytes, *, tokens: TITokens = None) -> Iterator[TIToken]:
+    """
+    Lazily decodes a byte stream into `TIToken` objects
 
-            curr_bytes = b''
-            index -= 1
+    Tokens are produced as they are read, so consumers which stop early do not decode the entire stream.
 
-        index += 1
+    :param bytestream: The token bytes to decode
+    :param tokens: The `TITokens` object to use for decoding (defaults to the TI-84+CE tokens)
+    :return: An iterator over the `TIToken` objects in ``bytestream``
+    """
 
-    return out, since
+    return _decode(bytestream, (tokens or TI_84PCE.tokens).first_bytes, {})
 
 
-__all__ = ["decode"]
+__all__ = ["decode", "decode_iter"]
@@ -11,6 +11,10 @@ from tivars.trie import *
 from .state import *
 
 
+# Characters which are folded into θ
+_theta_pattern = re.compile("[\u0398\u03F4\u1DBF]")
+
+
 def encode(string: str, *,
            trie: TITokenTrie = None, mode: str = None, normalize: bool = True) -> tuple[bytes, OsVersion]:
     """
@@ -46,7 +50,7 @@ def encode(string: str, *,
     trie = trie or TI_84PCE.tokens.tries[None]
     mode = mode or "smart"
 
-    data = b''
+    data = bytearray()
     since = OsVersions.INITIAL
     index = 0
 
@@ -80,7 +84,7 @@ def encode(string: str, *,
         index += len(string) - len(remainder)
         string = remainder
 
-    return data, since
+    return bytes(data), since
 
 
 def normalize(string: str):
@@ -91,7 +95,7 @@ def normalize(string: str):
     :return: The text in ``string`` normalized
     """
 
-    return re.sub("[\u0398\u03F4\u1DBF]", "θ", unicodedata.normalize("NFC", string))
+    return _theta_pattern.sub("θ", unicodedata.normalize("NFC", string))
 
 
 # Yucky scope nonsense to avoid a globals() call
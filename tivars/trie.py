@@ -88,7 +88,8 @@ class TITokens:
 
     The byte and name maps may be accessed via `__getitem__`.
 
-    Additionally, a trie map contains a `TITokenTrie` for each language, indexed by language code.
+    Additionally, a trie map contains a `TITokenTrie` for each language, indexed by language code,
+    and a first byte table maps each leading byte to its token or to the two-byte tokens it begins.
     """
 
     def __init__(self, tokens: Tokens):
@@ -102,6 +103,15 @@ class TITokens:
         # Tries
         self.tries = {lang: TITokenTrie.from_tokens(self, lang) for lang in self.langs}
 
+        # Decoding table indexed by first byte: a single-byte token, or a map of second bytes to two-byte tokens
+        self.first_bytes = [{} for _ in range(256)]
+        for bits, token in self.bytes.items():
+            if len(bits) == 1:
+                self.first_bytes[bits[0]] = token
+
+            elif isinstance(self.first_bytes[bits[0]], dict):
+                self.first_bytes[bits[0]][bits[1]] = token
+
         self.langs[None] = self.langs["en"]
         self.tries[None] = self.tries["en"]
 
@@ -285,9 +285,8 @@ class TIGraphedEquation(TIEquation, register=True, override=0x23):
         return self.decode(self.raw.name, mode="accessible").strip("{}|")
 
     def load_data_section(self, data: BytesIO):
-        flag_byte = data.read(1)
-        data_length = int.from_bytes(length_bytes := data.read(2), 'little')
-        self.raw.calc_data = bytearray(flag_byte + length_bytes + data.read(data_length))
+        self.raw.calc_data = bytearray(data.read(3))
+        self.raw.calc_data += data.read(int.from_bytes(self.raw.calc_data[1:], 'little'))
 
     @Loader[dict]
     def load_dict(self, dct: dict):
@@ -4,13 +4,23 @@ Graph window and table settings
 
 
 import json
+import struct
 
+from collections.abc import Callable
+from functools import lru_cache
 from warnings import warn
 
 from tivars.data import *
 from tivars.models import *
 from tivars.var import SizedEntry
-from .real import GraphRealEntry
+from .real import GraphRealEntry, TIReal
+
+
+# Settings are flat JSON objects, so their key-value pairs can be loaded without building a dict
+_decode_pairs = json.JSONDecoder(object_pairs_hook=list).decode
+
+# The views copy the data of loaded reals, which are otherwise only read from, so the same value can share one entry
+_load_real = lru_cache(maxsize=256, typed=True)(TIReal)
 
 
 class SettingsEntry(SizedEntry):
@@ -22,6 +32,28 @@ class SettingsEntry(SizedEntry):
 
     min_data_length = 2
 
+    _integer_settings = ()
+    _settings = {}
+    _settings_struct = struct.Struct("")
+
+    _dict_cache = None, None
+
+    def __init_subclass__(cls, /, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Every real setting in declaration order, with its slice of the data and how to read it
+        cls._settings = {name: (view.indices, cls._int if name in cls._integer_settings else cls._json_number)
+                         for name, view in cls.__dict__.items()
+                         if isinstance(view, View) and view._converter is GraphRealEntry}
+
+        # Unpack every setting from the data in one pass
+        layout, offset = "", 0
+        for indices, _ in cls._settings.values():
+            layout += f"{indices.start - offset}x{indices.stop - indices.start}s"
+            offset = indices.stop
+
+        cls._settings_struct = struct.Struct(layout)
+
     def __format__(self, format_spec: str) -> str:
         match format_spec:
             case "":
@@ -30,136 +62,282 @@ class SettingsEntry(SizedEntry):
             case _:
                 return super().__format__(format_spec)
 
+    def dict(self) -> dict:
+        # The dict is cached against a snapshot of the data, since views write into it in place
+        if (cache := self._dict_cache)[0] != (data := self.raw.calc_data):
+            self._dict_cache = cache = bytes(data), dict(zip(self._settings, self._values()))
+
+        return cache[1].copy()
+
+    def _values(self) -> list[float | str]:
+        """
+        :return: The JSON values of all real settings in declaration order
+        """
+
+        return [read(data) for (_, read), data in zip(self._settings.values(),
+                                                      self._settings_struct.unpack_from(self.raw.calc_data))]
+
     @Loader[dict]
     def load_dict(self, dct: dict):
         """
         Loads a JSON ``dict`` into this settings entry
 
+        Every value is stored as a `TIReal`, since JSON numbers do not record the subtype of a real.
+        In particular, undefined reals (such as the initial values of sequences) are loaded as ordinary reals.
+
         :param dct: The dict to load
         """
 
-        for var, value in dct:
-            if not hasattr(self, var):
+        self._load_pairs(dct.items())
+
+    @Loader[str]
+    def load_string(self, string: str):
+        """
+        Loads a JSON string into this settings entry
+
+        As with `load_dict`, every value is stored as a `TIReal`; undefined reals are loaded as ordinary reals.
+
+        :param string: The string to load
+        """
+
+        self._load_pairs(_decode_pairs(string))
+
+    def _load_pairs(self, pairs):
+        """
+        Loads JSON key-value pairs into this settings entry
+
+        :param pairs: The pairs to load
+        """
+
+        for var, value in pairs:
+            # Check the settings table rather than the attribute, which would decode the current value
+            if var not in self._settings:
                 warn(f"Unrecognized window setting ({var}).",
                      UserWarning)
+
+            elif isinstance(value, (int, float, str)):
+                setattr(self, var, _load_real(value))
+
             else:
-                setattr(self, var, GraphRealEntry(value))
+                raise TypeError(f"could not load window setting '{var}' from type {type(value)}")
 
-    @Loader[str]
-    def load_string(self, string: str):
-        self.load_dict(json.loads(string))
+    @staticmethod
+    def _integer(value: GraphRealEntry, minimum: int = None, maximum: int = None, *,
+                 name: str = None) -> GraphRealEntry:
+        """
+        Validates that a real setting is an integer, optionally within some bounds
 
+        :param value: The value of the setting
+        :param minimum: The minimum value of the setting (defaults to no minimum)
+        :param maximum: The maximum value of the setting (defaults to no maximum)
+        :param name: The name of the setting to warn with (defaults to none)
+        :return: The value of the setting
+        """
 
-class TIWindowSettings(SettingsEntry, register=True):
-    """
-    Parser for window settings
+        data = bytes(value.calc_data)
 
-    A `TIWindowSettings` stores all plot window parameters as a contiguous stream of `TIReal` values.
-    """
+        if not SettingsEntry._is_integer(data) or minimum is not None and SettingsEntry._int(data) < minimum \
+                or maximum is not None and SettingsEntry._int(data) > maximum:
+            warn(f"Expected an integer{f' for {name}' if name else ''}"
+                 f"{f' between {minimum} and {maximum}' if minimum is not None else ''}, got {float(value)}.",
+                 UserWarning)
 
-    extensions = {
-        None: "8xw",
-        TI_82: "82w",
-        TI_83: "83w",
-        TI_83P: "8xw"
-    }
+        return value
 
-    min_data_length = 210
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _is_integer(data: bytes) -> bool:
+        """
+        Checks whether a real setting is an integer without converting it
 
-    _type_id = 0x0F
+        :param data: The data of the setting
+        :return: Whether the setting is an integer
+        """
 
-    def __init__(self, init=None, *,
-                 for_flash: bool = True, name: str = "Window",
-                 version: int = None, archived: bool = None,
-                 data: bytes = None):
+        # Only a well-formed BCD mantissa can be checked digit by digit
+        if data[0] & 0x3F in (0x00, 0x0E, 0x18) and (mantissa := data[2:9].hex()).isdigit():
+            # No nonzero mantissa digits may lie past the decimal point
+            return not mantissa[max(data[1] - 0x7F, 0):].strip("0")
 
-        super().__init__(init, for_flash=for_flash, name=name, version=version, archived=archived, data=data)
+        return int(value := GraphRealEntry.get(data)) == float(value)
 
-    @Section(8, String)
-    def name(self) -> str:
+    @staticmethod
+    def _float(data: bytes) -> float:
         """
-        The name of the entry
+        Reads a real setting as a ``float`` without constructing an intermediate entry
 
-        This value is always ``Window``.
+        Only the floating point formats are decoded directly; any other value is read through `GraphRealEntry`.
+
+        :param data: The data of the setting
+        :return: The value of the setting
         """
 
-    @Section(min_data_length)
-    def calc_data(self) -> bytes:
-        pass
+        # TIReal, TIUndefinedReal, or TIRealFraction
+        if data[0] & 0x3F in (0x00, 0x0E, 0x18):
+            try:
+                # The BCD mantissa digits are exactly its hex digits
+                return float(f"{'-' if data[0] & 0x80 else ''}{data[2:9].hex()}e{data[1] - 0x80 - 13}") or 0.0
+
+            except ValueError:
+                pass
+
+        return float(GraphRealEntry.get(data))
 
-    @View(calc_data, GraphRealEntry)[3:12]
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _int(data: bytes) -> int:
+        """
+        Reads an integer setting as an ``int`` without constructing an intermediate entry
+
+        The integer part is read straight from the mantissa digits, truncating like ``int(float(...))``.
+
+        :param data: The data of the setting
+        :return: The value of the setting
+        """
+
+        # Only a well-formed BCD mantissa can be read digit by digit
+        if data[0] & 0x3F in (0x00, 0x0E, 0x18) and (mantissa := data[2:9].hex()).isdigit():
+            if (exponent := data[1] - 0x80) < 0:
+                return 0
+
+            elif exponent < 14:
+                return -int(mantissa[:exponent + 1]) if data[0] & 0x80 else int(mantissa[:exponent + 1])
+
+        return int(SettingsEntry._float(data))
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _json_number(data: bytes) -> float | str:
+        """
+        Reads a real setting as a JSON number without constructing an intermediate entry
+
+        :param data: The data of the setting
+        :return: The value of the setting as given by `RealEntry.json_number`
+        """
+
+        return number if len(str(number := SettingsEntry._float(data))) <= 6 else str(number)
+
+
+class _WindowSetting:
+    """
+    Declaration of a window setting, relative to the start of the stream of window parameters
+
+    Each window type turns its settings into `View` objects at the offset of the stream in its data.
+    """
+
+    def __init__(self, indices: slice):
+        self.indices = indices
+        self.func = None
+
+    def __class_getitem__(cls, indices: slice) -> '_WindowSetting':
+        return cls(indices)
+
+    def __call__(self, func: Callable) -> '_WindowSetting':
+        self.func = func
+        return self
+
+
+class _WindowEntry(SettingsEntry):
+    """
+    Base class for window settings entries
+
+    A window settings entry stores all plot window parameters as a contiguous stream of `TIReal` values.
+    The parameters are declared relative to the start of the stream, which each window type places in its data.
+    """
+
+    _integer_settings = ("PlotStart", "nMax", "nMin", "PlotStep", "Xres")
+
+    _window_offset = 0
+
+    def __init_subclass__(cls, /, **kwargs):
+        # Declare each window setting as a view at the start of the stream in this type's data
+        for name, setting in _WindowEntry.__dict__.items():
+            if isinstance(setting, _WindowSetting):
+                # Types may redeclare a setting to document it differently, which is then moved back into stream order
+                if isinstance(redeclared := cls.__dict__.get(name), _WindowSetting):
+                    setting = redeclared
+                    delattr(cls, name)
+
+                indices = slice(setting.indices.start + cls._window_offset, setting.indices.stop + cls._window_offset)
+                view = View(cls.calc_data, GraphRealEntry)[indices](setting.func)
+                view.__set_name__(cls, name)
+                setattr(cls, name, view)
+
+        super().__init_subclass__(**kwargs)
+
+    @_WindowSetting[0:9]
     def Xmin(self) -> GraphRealEntry:
         """
         Xmin: the X-coordinate of the left edge of the graphscreen
         """
 
-    @View(calc_data, GraphRealEntry)[12:21]
+    @_WindowSetting[9:18]
     def Xmax(self) -> GraphRealEntry:
         """
         Xmax: the X-coordinate of the right edge of the graphscreen
         """
 
-    @View(calc_data, GraphRealEntry)[21:30]
+    @_WindowSetting[18:27]
     def Xscl(self) -> GraphRealEntry:
         """
         Xscl: the separation between ticks on the X-axis
         """
 
-    @View(calc_data, GraphRealEntry)[30:39]
+    @_WindowSetting[27:36]
     def Ymin(self) -> GraphRealEntry:
         """
         Ymin: the Y-coordinate of the bottom edge of the graphscreen
         """
 
-    @View(calc_data, GraphRealEntry)[39:48]
+    @_WindowSetting[36:45]
     def Ymax(self) -> GraphRealEntry:
         """
         Ymax: the Y-coordinate of the top edge of the graphscreen
         """
 
-    @View(calc_data, GraphRealEntry)[48:57]
+    @_WindowSetting[45:54]
     def Yscl(self) -> GraphRealEntry:
         """
         Yscl: the separation between ticks on the Y-axis
         """
 
-    @View(calc_data, GraphRealEntry)[57:66]
+    @_WindowSetting[54:63]
     def Thetamin(self) -> GraphRealEntry:
         """
         Θmin: the initial angle for polar plots
         """
 
-    @View(calc_data, GraphRealEntry)[66:75]
+    @_WindowSetting[63:72]
     def Thetamax(self) -> GraphRealEntry:
         """
         Θmax: the final angle for polar plots
         """
 
-    @View(calc_data, GraphRealEntry)[75:84]
+    @_WindowSetting[72:81]
     def Thetastep(self) -> GraphRealEntry:
         """
         Θstep: the angle increment for polar plots
         """
 
-    @View(calc_data, GraphRealEntry)[84:93]
+    @_WindowSetting[81:90]
     def Tmin(self) -> GraphRealEntry:
         """
         Tmin: the initial time for parametric plots
         """
 
-    @View(calc_data, GraphRealEntry)[93:102]
+    @_WindowSetting[90:99]
     def Tmax(self) -> GraphRealEntry:
         """
         Tmax: the final time for parametric plots
         """
 
-    @View(calc_data, GraphRealEntry)[102:111]
+    @_WindowSetting[99:108]
     def Tstep(self) -> GraphRealEntry:
         """
         Tstep: the time increment for parametric plots
         """
 
-    @View(calc_data, GraphRealEntry)[111:120]
+    @_WindowSetting[108:117]
     def PlotStart(self, value) -> GraphRealEntry:
         """
         PlotStart: the initial value of 𝑛 for sequential plots
@@ -167,13 +345,9 @@ class TIWindowSettings(SettingsEntry, register=True):
         The value must be an integer.
         """
 
-        if int(value) != float(value):
-            warn(f"Expected an integer, got {float(value)}.",
-                 UserWarning)
-
-        return value
+        return self._integer(value)
 
-    @View(calc_data, GraphRealEntry)[120:129]
+    @_WindowSetting[117:126]
     def nMax(self, value) -> GraphRealEntry:
         """
         𝑛Max: the final value of 𝑛 for sequential equations and plots
@@ -181,25 +355,21 @@ class TIWindowSettings(SettingsEntry, register=True):
         The value must be an integer.
         """
 
-        if int(value) != float(value):
-            warn(f"Expected an integer, got {float(value)}.",
-                 UserWarning)
-
-        return value
+        return self._integer(value)
 
-    @View(calc_data, GraphRealEntry)[129:138]
+    @_WindowSetting[126:135]
     def unMin0(self) -> GraphRealEntry:
         """
         u(𝑛Min): the initial value of u at 𝑛Min
         """
 
-    @View(calc_data, GraphRealEntry)[138:147]
+    @_WindowSetting[135:144]
     def vnMin0(self) -> GraphRealEntry:
         """
         v(𝑛Min): the initial value of v at 𝑛Min
         """
 
-    @View(calc_data, GraphRealEntry)[147:156]
+    @_WindowSetting[144:153]
     def nMin(self, value) -> GraphRealEntry:
         """
         𝑛Min: the initial value of 𝑛 for sequential plots
@@ -207,31 +377,27 @@ class TIWindowSettings(SettingsEntry, register=True):
         The value must be an integer.
         """
 
-        if int(value) != float(value):
-            warn(f"Expected an integer, got {float(value)}.",
-                 UserWarning)
-
-        return value
+        return self._integer(value)
 
-    @View(calc_data, GraphRealEntry)[156:165]
+    @_WindowSetting[153:162]
     def unMin1(self) -> GraphRealEntry:
         """
         u(𝑛Min+1): the initial value of u at 𝑛Min + 1
         """
 
-    @View(calc_data, GraphRealEntry)[165:174]
+    @_WindowSetting[162:171]
     def vnMin1(self) -> GraphRealEntry:
         """
         v(𝑛Min+1): the initial value of v at 𝑛Min + 1
         """
 
-    @View(calc_data, GraphRealEntry)[174:183]
+    @_WindowSetting[171:180]
     def wnMin0(self) -> GraphRealEntry:
         """
         w(𝑛Min): the initial value of w at 𝑛Min
         """
 
-    @View(calc_data, GraphRealEntry)[183:192]
+    @_WindowSetting[180:189]
     def PlotStep(self, value) -> GraphRealEntry:
         """
         PlotStep: the 𝑛 increment for sequential plots
@@ -239,13 +405,9 @@ class TIWindowSettings(SettingsEntry, register=True):
         The value must be an integer.
         """
 
-        if int(value) != float(value):
-            warn(f"Expected an integer, got {float(value)}.",
-                 UserWarning)
+        return self._integer(value)
 
-        return value
-
-    @View(calc_data, GraphRealEntry)[192:201]
+    @_WindowSetting[189:198]
     def Xres(self, value) -> GraphRealEntry:
         """
         Xres: the pixel separation of points in a function plot
@@ -253,66 +415,37 @@ class TIWindowSettings(SettingsEntry, register=True):
         The value must be an integer in ``[1,8]``.
         """
 
-        if int(value) != float(value) or not 1 <= int(value) <= 8:
-            warn(f"Expected an integer between 1 and 8, got {float(value)}.",
-                 UserWarning)
+        return self._integer(value, 1, 8)
 
-        return value
-
-    @View(calc_data, GraphRealEntry)[201:210]
+    @_WindowSetting[198:207]
     def wnMin1(self) -> GraphRealEntry:
         """
         w(𝑛Min+1): the initial value of w at 𝑛Min + 1
         """
 
-    def dict(self) -> dict:
-        return {
-            "Xmin": self.Xmin.json_number(),
-            "Xmax": self.Xmax.json_number(),
-            "Xscl": self.Xscl.json_number(),
-            "Ymin": self.Ymin.json_number(),
-            "Ymax": self.Ymax.json_number(),
-            "Yscl": self.Yscl.json_number(),
-            "Thetamin": self.Thetamin.json_number(),
-            "Thetamax": self.Thetamax.json_number(),
-            "Thetastep": self.Thetastep.json_number(),
-            "Tmin": self.Tmin.json_number(),
-            "Tmax": self.Tmax.json_number(),
-            "Tstep": self.Tstep.json_number(),
-            "PlotStart": int(self.PlotStart),
-            "nMax": int(self.nMax),
-            "unMin0": self.unMin0.json_number(),
-            "vnMin0": self.vnMin0.json_number(),
-            "nMin": int(self.nMin),
-            "unMin1": self.unMin1.json_number(),
-            "vnMin1": self.vnMin1.json_number(),
-            "wnMin0": self.wnMin0.json_number(),
-            "PlotStep": int(self.PlotStep),
-            "Xres": int(self.Xres),
-            "wnMin1": self.wnMin1.json_number()
-        }
-
-
-class TIRecallWindow(SettingsEntry, register=True):
+
+class TIWindowSettings(_WindowEntry, register=True):
     """
-    Parser for recalled windows
+    Parser for window settings
 
-    A `TIRecallWindow` stores all plot window parameters as a contiguous stream of `TIReal` values.
+    A `TIWindowSettings` stores all plot window parameters as a contiguous stream of `TIReal` values.
     """
 
     extensions = {
-        None: "8xz",
-        TI_82: "82z",
-        TI_83: "83z",
-        TI_83P: "8xz"
+        None: "8xw",
+        TI_82: "82w",
+        TI_83: "83w",
+        TI_83P: "8xw"
     }
 
-    min_data_length = 209
+    min_data_length = 210
 
-    _type_id = 0x10
+    _window_offset = 3
+
+    _type_id = 0x0F
 
     def __init__(self, init=None, *,
-                 for_flash: bool = True, name: str = "RclWindw",
+                 for_flash: bool = True, name: str = "Window",
                  version: int = None, archived: bool = None,
                  data: bytes = None):
 
@@ -323,126 +456,54 @@ class TIRecallWindow(SettingsEntry, register=True):
         """
         The name of the entry
 
-        This value is always ``RclWindw``.
+        This value is always ``Window``.
         """
 
     @Section(min_data_length)
     def calc_data(self) -> bytes:
         pass
 
-    @View(calc_data, GraphRealEntry)[2:11]
-    def Xmin(self) -> GraphRealEntry:
-        """
-        Xmin: the X-coordinate of the left edge of the graphscreen
-        """
 
-    @View(calc_data, GraphRealEntry)[11:20]
-    def Xmax(self) -> GraphRealEntry:
-        """
-        Xmax: the X-coordinate of the right edge of the graphscreen
-        """
-
-    @View(calc_data, GraphRealEntry)[20:29]
-    def Xscl(self) -> GraphRealEntry:
-        """
-        Xscl: the separation between ticks on the X-axis
-        """
-
-    @View(calc_data, GraphRealEntry)[29:38]
-    def Ymin(self) -> GraphRealEntry:
-        """
-        Ymin: the Y-coordinate of the bottom edge of the graphscreen
-        """
-
-    @View(calc_data, GraphRealEntry)[38:47]
-    def Ymax(self) -> GraphRealEntry:
-        """
-        Ymax: the Y-coordinate of the top edge of the graphscreen
-        """
-
-    @View(calc_data, GraphRealEntry)[47:56]
-    def Yscl(self) -> GraphRealEntry:
-        """
-        Yscl: the separation between ticks on the Y-axis
-        """
-
-    @View(calc_data, GraphRealEntry)[56:65]
-    def Thetamin(self) -> GraphRealEntry:
-        """
-        Θmin: the initial angle for polar plots
-        """
-
-    @View(calc_data, GraphRealEntry)[65:74]
-    def Thetamax(self) -> GraphRealEntry:
-        """
-        Θmax: the final angle for polar plots
-        """
-
-    @View(calc_data, GraphRealEntry)[74:83]
-    def Thetastep(self) -> GraphRealEntry:
-        """
-        Θstep: the angle increment for polar plots
-        """
-
-    @View(calc_data, GraphRealEntry)[83:92]
-    def Tmin(self) -> GraphRealEntry:
-        """
-        Tmin: the initial time for parametric plots
-        """
+class TIRecallWindow(_WindowEntry, register=True):
+    """
+    Parser for recalled windows
 
-    @View(calc_data, GraphRealEntry)[92:101]
-    def Tmax(self) -> GraphRealEntry:
-        """
-        Tmax: the final time for parametric plots
-        """
+    A `TIRecallWindow` stores all plot window parameters as a contiguous stream of `TIReal` values.
+    """
 
-    @View(calc_data, GraphRealEntry)[101:110]
-    def Tstep(self) -> GraphRealEntry:
-        """
-        Tstep: the time increment for parametric plots
-        """
+    extensions = {
+        None: "8xz",
+        TI_82: "82z",
+        TI_83: "83z",
+        TI_83P: "8xz"
+    }
 
-    @View(calc_data, GraphRealEntry)[110:119]
-    def PlotStart(self, value) -> GraphRealEntry:
-        """
-        PlotStart: the initial value of 𝑛 for sequential plots
+    min_data_length = 209
 
-        The value must be an integer.
-        """
+    _window_offset = 2
 
-        if int(value) != float(value):
-            warn(f"Expected an integer, got {float(value)}.",
-                 UserWarning)
+    _type_id = 0x10
 
-        return value
+    def __init__(self, init=None, *,
+                 for_flash: bool = True, name: str = "RclWindw",
+                 version: int = None, archived: bool = None,
+                 data: bytes = None):
 
-    @View(calc_data, GraphRealEntry)[119:128]
-    def nMax(self, value) -> GraphRealEntry:
-        """
-        𝑛Max: the final value of 𝑛 for sequential equations and plots
+        super().__init__(init, for_flash=for_flash, name=name, version=version, archived=archived, data=data)
 
-        The value must be an integer.
+    @Section(8, String)
+    def name(self) -> str:
         """
+        The name of the entry
 
-        if int(value) != float(value):
-            warn(f"Expected an integer, got {float(value)}.",
-                 UserWarning)
-
-        return value
-
-    @View(calc_data, GraphRealEntry)[128:137]
-    def unMin0(self) -> GraphRealEntry:
-        """
-        u(𝑛Min): the initial value of u at 𝑛Min
+        This value is always ``RclWindw``.
         """
 
-    @View(calc_data, GraphRealEntry)[137:146]
-    def vnMin0(self) -> GraphRealEntry:
-        """
-        v(𝑛Min): the initial value of v at 𝑛Min
-        """
+    @Section(min_data_length)
+    def calc_data(self) -> bytes:
+        pass
 
-    @View(calc_data, GraphRealEntry)[146:155]
+    @_WindowSetting[144:153]
     def nMin(self, value) -> GraphRealEntry:
         """
         𝑛Min: the initial value of 𝑛 for sequential equations
@@ -450,91 +511,26 @@ class TIRecallWindow(SettingsEntry, register=True):
         The value must be an integer.
         """
 
-        if int(value) != float(value):
-            warn(f"Expected an integer, got {float(value)}.",
-                 UserWarning)
-
-        return value
+        return self._integer(value)
 
-    @View(calc_data, GraphRealEntry)[155:164]
+    @_WindowSetting[153:162]
     def unMin1(self) -> GraphRealEntry:
         """
         u(𝑛Min + 1): the initial value of u at 𝑛Min + 1
         """
 
-    @View(calc_data, GraphRealEntry)[164:173]
+    @_WindowSetting[162:171]
     def vnMin1(self) -> GraphRealEntry:
         """
         v(𝑛Min + 1): the initial value of v at 𝑛Min + 1
         """
 
-    @View(calc_data, GraphRealEntry)[173:182]
-    def wnMin0(self) -> GraphRealEntry:
-        """
-        w(𝑛Min): the initial value of w at 𝑛Min
-        """
-
-    @View(calc_data, GraphRealEntry)[182:191]
-    def PlotStep(self, value) -> GraphRealEntry:
-        """
-        PlotStep: the 𝑛 increment for sequential plots
-
-        The value must be an integer.
-        """
-
-        if int(value) != float(value):
-            warn(f"Expected an integer, got {float(value)}.",
-                 UserWarning)
-
-        return value
-
-    @View(calc_data, GraphRealEntry)[191:200]
-    def Xres(self, value) -> GraphRealEntry:
-        """
-        Xres: the pixel separation of points in a function plot
-
-        The value must be an integer in ``[1,8]``.
-        """
-
-        if int(value) != float(value) or not 1 <= int(value) <= 8:
-            warn(f"Expected an integer between 1 and 8, got {float(value)}.",
-                 UserWarning)
-
-        return value
-
-    @View(calc_data, GraphRealEntry)[200:209]
+    @_WindowSetting[198:207]
     def wnMin1(self) -> GraphRealEntry:
         """
         w(𝑛Min + 1): the initial value of w at 𝑛Min + 1
         """
 
-    def dict(self) -> dict:
-        return {
-            "Xmin": self.Xmin.json_number(),
-            "Xmax": self.Xmax.json_number(),
-            "Xscl": self.Xscl.json_number(),
-            "Ymin": self.Ymin.json_number(),
-            "Ymax": self.Ymax.json_number(),
-            "Yscl": self.Yscl.json_number(),
-            "Thetamin": self.Thetamin.json_number(),
-            "Thetamax": self.Thetamax.json_number(),
-            "Thetastep": self.Thetastep.json_number(),
-            "Tmin": self.Tmin.json_number(),
-            "Tmax": self.Tmax.json_number(),
-            "Tstep": self.Tstep.json_number(),
-            "PlotStart": int(self.PlotStart),
-            "nMax": int(self.nMax),
-            "unMin0": self.unMin0.json_number(),
-            "vnMin0": self.vnMin0.json_number(),
-            "nMin": int(self.nMin),
-            "unMin1": self.unMin1.json_number(),
-            "vnMin1": self.vnMin1.json_number(),
-            "wnMin0": self.wnMin0.json_number(),
-            "PlotStep": int(self.PlotStep),
-            "Xres": int(self.Xres),
-            "wnMin1": self.wnMin1.json_number()
-        }
-
 
 class TITableSettings(SettingsEntry, register=True):
     """
@@ -552,6 +548,8 @@ class TITableSettings(SettingsEntry, register=True):
 
     min_data_length = 20
 
+    _integer_settings = ("TblMin", "DeltaTbl")
+
     _type_id = 0x11
 
     def __init__(self, init=None, *,
@@ -581,11 +579,7 @@ class TITableSettings(SettingsEntry, register=True):
         The value must be an integer.
         """
 
-        if int(value) != float(value):
-            warn(f"Expected an integer for TblMin, got {float(value)}.",
-                 UserWarning)
-
-        return value
+        return self._integer(value, name="TblMin")
 
     @View(calc_data, GraphRealEntry)[11:20]
     def DeltaTbl(self, value) -> GraphRealEntry:
@@ -595,17 +589,7 @@ class TITableSettings(SettingsEntry, register=True):
         The value must be an integer.
         """
 
-        if int(value) != float(value):
-            warn(f"Expected an integer for ΔTbl, got {float(value)}.",
-                 UserWarning)
-
-        return value
-
-    def dict(self) -> dict:
-        return {
-            "TblMin": int(self.TblMin),
-            "DeltaTbl": int(self.DeltaTbl)
-        }
+        return self._integer(value, name="ΔTbl")
 
 
 __all__ = ["TIWindowSettings", "TIRecallWindow", "TITableSettings"]
@@ -42,17 +42,40 @@ class TokenizedEntry(SizedEntry):
     These tokens influence the entry's version, though detecting the presence of the RTC has no current application.
     """
 
+    # Search for all clock tokens in a single pass
+    _clock_pattern = re.compile(b"|".join(map(re.escape, clock_tokens)))
+
+    _format_spec_pattern = re.compile(r"(?:(.*?[a-z%#])(\W+))?(\w?)(\.\w+)?$")
+
+    _decode_cache = None, None
+    _version_cache = None, None
+    _string_cache = None, None
+
+    # The earliest OS supporting each version, newest first
+    _version_thresholds = (
+        (TI_84PCE.OS("5.3"), 0x0C),
+        (TI_84PCE.OS("5.2"), 0x0B),
+        (TI_84PCSE.OS("4.0"), 0x0A),
+        (TI_84P.OS("2.55"), 0x07),
+        (TI_84P.OS("2.53"), 0x06),
+        (TI_84P.OS("2.30"), 0x05),
+        (TI_84P.OS("2.21"), 0x04),
+        (TI_83P.OS("1.16"), 0x03),
+        (TI_83P.OS("1.15"), 0x02),
+        (TI_83P.OS("1.00"), 0x01),
+    )
+
     def __format__(self, format_spec: str) -> str:
         try:
-            lines, sep, spec, lang = re.match(r"(?:(.*?[a-z%#])(\W+))?(\w?)(\.\w+)?$", format_spec).groups()
+            lines, sep, spec, lang = self._format_spec_pattern.match(format_spec).groups()
             lang = (lang or ".en")[1:]
 
             match spec:
                 case "" | "d":
-                    string = self.decode(self.data, lang=lang)
+                    string = "".join(token.langs[lang].display for token in self._decoded()[0])
 
                 case "a" | "t":
-                    string = self.decode(self.data, lang=lang, mode="accessible")
+                    string = "".join(token.langs[lang].accessible for token in self._decoded()[0])
 
                 case _:
                     raise KeyError
@@ -67,7 +90,7 @@ class TokenizedEntry(SizedEntry):
             return super().__format__(format_spec)
 
     def __iter__(self) -> Iterator[TIToken]:
-        return iter(self.tokens())
+        return decode_iter(self.data)
 
     @staticmethod
     def decode(data: bytes, *, model: TIModel = None, lang: str = None, mode: str = None) -> str:
@@ -106,48 +129,68 @@ class TokenizedEntry(SizedEntry):
         model = model or TI_84PCE
         return encode(string, trie=model.tokens.tries[lang or model.lang], mode=mode)[0]
 
+    def _decoded(self, data: bytes = None) -> tuple[list[TIToken], OsVersion]:
+        # The result is cached against the data, which is decoded again only if it changes
+        if (cache := self._decode_cache)[0] != (data := bytes(data or self.data)):
+            decoded = decode(data)
+
+            # Data with illegal tokens is decoded on every call, so its warnings are emitted each time
+            if any(isinstance(token, IllegalToken) for token in decoded[0]):
+                return decoded
+
+            self._decode_cache = cache = data, decoded
+
+        return cache[1]
+
     def get_min_os(self, data: bytes = None) -> OsVersion:
-        return decode(data or self.data)[1]
+        return self._decoded(data)[1]
 
-    def get_version(self, data: bytes = None) -> int:
-        match self.get_min_os(data):
-            case os if os >= TI_84PCE.OS("5.3"):
-                version = 0x0C
+    @staticmethod
+    def _has_illegal_tokens(data: bytes) -> bool:
+        """
+        Checks whether a byte stream would decode with any illegal tokens, without emitting warnings
 
-            case os if os >= TI_84PCE.OS("5.2"):
-                version = 0x0B
+        :param data: The token bytes to check
+        :return: Whether decoding ``data`` would produce an `IllegalToken`
+        """
 
-            case os if os >= TI_84PCSE.OS("4.0"):
-                version = 0x0A
+        first_bytes = TI_84PCE.tokens.first_bytes
 
-            case os if os >= TI_84P.OS("2.55"):
-                version = 0x07
+        index = 0
+        length = len(data)
+        while index < length:
+            if not data[index]:
+                # Only trailing null bytes are permitted
+                return bool(data[index:].strip(b"\x00"))
 
-            case os if os >= TI_84P.OS("2.53"):
-                version = 0x06
+            if isinstance(token := first_bytes[data[index]], dict):
+                if index + 1 < length and data[index + 1] not in token:
+                    return True
 
-            case os if os >= TI_84P.OS("2.30"):
-                version = 0x05
+                index += 2
 
-            case os if os >= TI_84P.OS("2.21"):
-                version = 0x04
+            else:
+                index += 1
 
-            case os if os >= TI_83P.OS("1.16"):
-                version = 0x03
+        return False
 
-            case os if os >= TI_83P.OS("1.15"):
-                version = 0x02
+    def get_version(self, data: bytes = None) -> int:
+        # The class is part of the key, since coercion can change how the minimum OS is found
+        if (cache := self._version_cache)[0] != (key := (self.__class__, data := bytes(data or self.data))):
+            os = self.get_min_os(data)
+            version = next((version for threshold, version in self._version_thresholds if os >= threshold), 0x00)
 
-            case os if os >= TI_83P.OS("1.00"):
-                version = 0x01
+            # Every clock token begins with 0xEF, which is cheap to rule out first
+            if b'\xEF' in data and self._clock_pattern.search(data):
+                version += 0x20
 
-            case _:
-                version = 0x00
+            # Illegal tokens warn whenever they are decoded, so their results are never cached
+            if self._has_illegal_tokens(data):
+                return version
 
-        if any(token in (data or self.data) for token in self.clock_tokens):
-            version += 0x20
+            self._version_cache = cache = key, version
 
-        return version
+        return cache[1]
 
     @Loader[bytes, bytearray, BytesIO]
     def load_bytes(self, data: bytes | BytesIO):
@@ -185,14 +228,27 @@ class TokenizedEntry(SizedEntry):
         :param tokens: The sequence of tokens to load
         """
 
-        self.data = b''.join(token.bits for token in tokens)
+        self.data = b''.join([token.bits for token in tokens])
+
+    def string(self) -> str:
+        # The string is cached against the data, which is decoded again only if it changes
+        if (cache := self._string_cache)[0] != (data := bytes(self.data)):
+            string = format(self, "")
+
+            # As with decoding, a string with illegal tokens is rebuilt so that it warns each time
+            if self._has_illegal_tokens(data):
+                return string
+
+            self._string_cache = cache = data, string
+
+        return cache[1]
 
     def tokens(self) -> list[TIToken]:
         """
         :return: The tokens comprising this entry as a list of `TIToken` objects
         """
 
-        return decode(self.data)[0]
+        return self._decoded()[0].copy()
 
     def lines(self) -> list[list[TIToken]]:
         """
@@ -204,31 +260,30 @@ class TokenizedEntry(SizedEntry):
         :return: The logical lines of this entry as lists of `TIToken` objects
         """
 
-        tokens = self.tokens()
-        lines = [[]]
+        # Decoded tokens are shared TI-84+CE token objects, so the separators can be compared by identity
+        tokens = TI_84PCE.tokens
+        store, quote, colon, newline = (tokens[bits] for bits in (b'\x04', b'\x2A', b'\x3E', b'\x3F'))
 
-        in_string = False
-        for token in tokens:
-            match token.bits:
-                #    ->
-                case b'\x04':
-                    in_string = False
+        line = []
+        lines = [line]
 
-                #    "
-                case b'\x2A':
-                    in_string = not in_string
+        in_string = False
+        for token in self._decoded()[0]:
+            #    ->
+            if token is store:
+                in_string = False
 
-                #    :
-                case b'\x3E' if not in_string:
-                    lines.append([])
+            #    "
+            elif token is quote:
+                in_string = not in_string
 
-                #    \n
-                case b'\x3F':
-                    in_string = False
-                    lines.append([])
+            #    :                                      \n
+            elif token is colon and not in_string or token is newline:
+                in_string = False
+                lines.append(line := [])
 
-                case _:
-                    lines[-1].append(token)
+            else:
+                line.append(token)
 
         return lines
 
@@ -249,6 +304,8 @@ class TIEquation(TokenizedEntry, register=True):
 
     leading_name_byte = b'\x5E'
 
+    _name_pattern = re.compile(r"\{?([XYr]\dT?)}?")
+
     _type_id = 0x03
 
     def __init__(self, init=None, *,
@@ -271,7 +328,7 @@ class TIEquation(TokenizedEntry, register=True):
         if varname in ("u", "v", "w"):
             varname = "|" + varname
 
-        elif match := re.fullmatch(r"\{?([XYr]\dT?)}?", varname):
+        elif match := self._name_pattern.fullmatch(varname):
             varname = "{" + match[1] + "}"
 
         return varname
@@ -414,19 +471,10 @@ class TIProgram(TokenizedEntry, register=True):
             return super().string()
 
     def coerce(self):
-        with catch_warnings():
-            simplefilter("error")
-
-            try:
-                self.string()
-                doors = False
-
-            except BytesWarning:
-                doors = True
+        data = self.data
+        doors = data.find(b"\xEF\x68") > 0 and self._has_illegal_tokens(data)
 
-        doors &= b"\xEF\x68" in self.data and self.data.index(b"\xEF\x68") > 0
-
-        match self.type_id, any(token in self.data for token in self.asm_tokens) | doors:
+        match self.type_id, any(token[0] in data and token in data for token in self.asm_tokens) | doors:
             case TIProgram.type_id, False:
                 self.__class__ = TIProgram
             case TIProgram.type_id, True:
@@ -449,9 +497,16 @@ class TIAsmProgram(TIProgram):
 
     is_tokenized = False
 
+    _asm_min_os_cache = None, None
+
     def get_min_os(self, data: bytes = None) -> OsVersion:
-        return max([model.OS() for token, model in self.asm_tokens.items() if token in (data or self.data)],
-                   default=OsVersions.INITIAL)
+        # Kept apart from the tokenized cache, since coercion can swap the class of an entry
+        if (cache := self._asm_min_os_cache)[0] != (data := bytes(data or self.data)):
+            self._asm_min_os_cache = cache = data, max([model.OS() for token, model in self.asm_tokens.items()
+                                                        if token[0] in data and token in data],
+                                                       default=OsVersions.INITIAL)
+
+        return cache[1]
 
 
 class TIProtectedProgram(TIProgram, register=True):
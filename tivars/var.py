@@ -3,9 +3,11 @@ The fundamental var components
 """
 
 
+import copy
 import re
 
 from collections.abc import Iterator
+from functools import lru_cache
 from io import BytesIO
 from sys import version_info
 from typing import BinaryIO
@@ -90,8 +92,9 @@ class TIHeader:
         :return: A copy of this header
         """
 
-        new = TIHeader()
-        new.load_bytes(self.bytes())
+        # The header bytes are immutable, so the raw container can be copied without reparsing
+        new = TIHeader.__new__(TIHeader)
+        new.raw = copy.copy(self.raw)
         return new
 
     def __eq__(self, other: 'TIHeader') -> bool:
@@ -173,14 +176,20 @@ class TIHeader:
         :return: A set of models that this header can target
         """
 
-        models = {m for m in TIModel.MODELS if m.magic == self.magic}
+        return set(self._targets(self.magic, self.product_id))
+
+    @staticmethod
+    @lru_cache
+    def _targets(magic: str, product_id: int) -> frozenset[TIModel]:
+        # The models are fixed, so the targets only depend on the magic and product ID
+        models = frozenset(m for m in TIModel.MODELS if m.magic == magic)
 
-        if self.product_id != 0x00:
-            if filtered := {m for m in models if m.product_id == self.product_id}:
+        if product_id != 0x00:
+            if filtered := frozenset(m for m in models if m.product_id == product_id):
                 return filtered
 
         if not models:
-            raise ValueError(f"file magic '{self.magic}' not recognized")
+            raise ValueError(f"file magic '{magic}' not recognized")
 
         return models
 
@@ -192,21 +201,21 @@ class TIHeader:
         """
 
         if hasattr(data, "read"):
-            data = BytesIO(data.read())
+            data = data.read(len(self))
 
-        data = BytesIO(data.ljust(len(self), b'\x00'))
+        data = bytes(data[:len(self)]).ljust(len(self), b'\x00')
 
         # Read magic
-        self.raw.magic = data.read(8)
+        self.raw.magic = data[0:8]
 
         # Read export bytes
-        self.raw.extra = data.read(2)
+        self.raw.extra = data[8:10]
 
         # Read product ID
-        self.raw.product_id = data.read(1)
+        self.raw.product_id = data[10:11]
 
         # Read comment
-        self.raw.comment = data.read(42)
+        self.raw.comment = data[11:53]
 
     def bytes(self) -> bytes:
         """
@@ -290,6 +299,11 @@ class TIEntry(Dock, Converter):
     _type_id = None
     _type_ids = {}
 
+    _clear_data = b''
+    _type_id_bytes = b'\xFF'
+
+    _hex_spec_pattern = re.compile(r"(?P<width>[+-]?\d+)?(?P<case>[xX])(?P<sep>\D)?")
+
     class Raw:
         """
         Raw bytes container for `TIEntry`
@@ -359,7 +373,7 @@ class TIEntry(Dock, Converter):
         self.raw = self.Raw()
 
         self.meta_length = TIEntry.flash_meta_length if for_flash else TIEntry.base_meta_length
-        self.type_id = self._type_id if self._type_id is not None else 0xFF
+        self.raw.type_id = self._type_id_bytes
         self.name = name
         self.archived = archived or False
         self.version = version or 0x00
@@ -375,7 +389,7 @@ class TIEntry(Dock, Converter):
 
         self.clear()
         if data:
-            self.data = bytearray(data)
+            self.data = data
             self.coerce()
 
         elif init is not None:
@@ -407,8 +421,11 @@ class TIEntry(Dock, Converter):
         :return: A copy of this entry
         """
 
-        new = self.__class__()
-        new.load_bytes(self.bytes())
+        # Only the data section is mutable; everything else is copied as-is without reparsing
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new.raw = copy.copy(self.raw)
+        new.raw.calc_data = self.raw.calc_data.copy()
         return new
 
     def __eq__(self, other: 'TIEntry') -> bool:
@@ -433,7 +450,14 @@ class TIEntry(Dock, Converter):
         :return: A string representation of this entry
         """
 
-        if match := re.fullmatch(r"(?P<width>[+-]?\d+)?(?P<case>[xX])(?P<sep>\D)?", format_spec):
+        # Plain hex specs are the most common, and need no parsing
+        if format_spec == "x":
+            return self.calc_data.hex()
+
+        elif format_spec == "X":
+            return self.calc_data.hex().upper()
+
+        elif match := self._hex_spec_pattern.fullmatch(format_spec):
             match match["sep"], match["width"]:
                 case None, None:
                     string = self.calc_data.hex()
@@ -458,6 +482,10 @@ class TIEntry(Dock, Converter):
     def __init_subclass__(cls, /, register=False, override=None, **kwargs):
         super().__init_subclass__(**kwargs)
 
+        # Build the data of a cleared entry and its type ID byte once
+        cls._clear_data = cls.leading_data_bytes.ljust(cls.min_data_length, b'\x00')
+        cls._type_id_bytes = bytes([cls._type_id if cls._type_id is not None else 0xFF])
+
         if register:
             TIEntry.register(cls, override)
 
@@ -664,8 +692,7 @@ class TIEntry(Dock, Converter):
         Clears this entry's data
         """
 
-        self.raw.calc_data = bytearray(self.leading_data_bytes)
-        self.raw.calc_data.extend(bytearray(self.min_data_length - self.calc_data_length))
+        self.raw.calc_data = bytearray(self._clear_data)
 
     def get_min_os(self, data: bytes = None) -> OsVersion:
         """
@@ -721,7 +748,11 @@ class TIEntry(Dock, Converter):
         if hasattr(data, "read"):
             data = data.read()
 
-        data = BytesIO(data.ljust(TIEntry.flash_meta_length + 4, b'\x00'))
+        # Only short inputs need padding; ljust always copies a bytearray
+        if len(data) < TIEntry.flash_meta_length + 4:
+            data = data.ljust(TIEntry.flash_meta_length + 4, b'\x00')
+
+        data = BytesIO(data)
 
         # Read meta length
         self.raw.meta_length = data.read(2)
@@ -874,7 +905,8 @@ class TIEntry(Dock, Converter):
             simplefilter("ignore")
 
             for entry_type in self._type_ids.values():
-                if issubclass(entry_type, self.__class__):
+                # Types without a dedicated string loader would only recurse back into this one
+                if issubclass(entry_type, self.__class__) and entry_type.load_string is not TIEntry.load_string:
                     try:
                         # Try out each possible string format
                         self.load_bytes(entry_type(string).bytes())
@@ -1298,6 +1330,14 @@ class SizedEntry(TIEntry):
 
     min_data_length = 2
 
+    def __init_subclass__(cls, /, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Build the data of a cleared entry once: its leading bytes and padding, with the length wherever it is stored
+        data = bytearray([0, 0, *cls.leading_data_bytes]).ljust(cls.min_data_length, b'\x00')
+        data[cls.length.indices] = int.to_bytes(len(data) - 2, 2, 'little')
+        cls._clear_data = bytes(data)
+
     @Section()
     def calc_data(self) -> bytes:
         pass
@@ -1312,22 +1352,18 @@ class SizedEntry(TIEntry):
     def data(self) -> bytes:
         pass
 
-    def clear(self):
-        self.raw.calc_data = bytearray([0, 0, *self.leading_data_bytes])
-        self.raw.calc_data.extend(bytearray(self.min_data_length - self.calc_data_length))
-        self.length = len(self.leading_data_bytes) + len(self.data)
-
     @Loader[bytes, bytearray, BytesIO]
     def load_bytes(self, data: bytes | BytesIO):
         super().load_bytes(data)
 
-        if self.length != (data_length := len(self.leading_data_bytes) + len(self.data)):
+        # The leading bytes are counted in the stored length
+        if self.length != (data_length := max(self.calc_data_length - 2, len(self.leading_data_bytes))):
             warn(f"The entry has an unexpected data length (expected {self.length}, got {data_length}).",
                  BytesWarning)
 
     def load_data_section(self, data: BytesIO):
-        data_length = int.from_bytes(length_bytes := data.read(2), 'little')
-        self.raw.calc_data = bytearray(length_bytes + data.read(data_length))
+        self.raw.calc_data = bytearray(data.read(2))
+        self.raw.calc_data += data.read(int.from_bytes(self.raw.calc_data, 'little'))
 
 
 __all__ = ["TIHeader", "TIEntry", "TIVar", "SizedEntry"]